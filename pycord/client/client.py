@@ -96,8 +96,9 @@ class Client:
 
         Because all the discord models are spread across multiple files, you need to be careful, to prevent importing
         2 files at the same time. One way that we can get around this, is annotations. This function will go through
-        all the annotated variables equal to None, and then set the value to the annotated class. Called when you
-        initilize the client, so there's little need to call this yourself.
+        all the annotated variables equal to None, and then set the value to the annotated class. After that, the models
+        are warmed up with :py:func:`~pycord.models.base.warmup`. Called when you initilize the client, so there's
+        little need to call this yourself.
 
         :return: Nothing
         """
@@ -107,6 +108,9 @@ class Client:
                 file, cls = annotation.rsplit('.', 1)
                 loaded_cls = getattr(__import__(file, fromlist=[cls]), cls)
                 setattr(self.config, name, loaded_cls)
+        # Now every model can be resolved, generate their constructors before the first events show up
+        from pycord.models import warmup
+        warmup(*(getattr(self.config, name) for name in self.config.__annotations__))
 
     def get_command(self, message: "pycord.models.message.Message"):
         """
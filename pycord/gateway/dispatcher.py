@@ -111,7 +111,8 @@ class AsyncDispatcher(Dispatcher):
                 self.client.gateway.session_id = data['d']['session_id']
             else:
                 event = self.events.get(data['t'])
-                if event and data['t'] == "MESSAGE_CREATE":
+                # Building a message isn't free, so don't bother when there aren't any commands to give it to
+                if event and data['t'] == "MESSAGE_CREATE" and self.client.commands:
                     msg = Message(self.client, data['d'])
                     for cmd, parsed_msg in self.client.get_command(msg):
                         await cmd.invoke(msg, parsed_msg)
@@ -10,6 +10,7 @@ from zlib import decompressobj
 
 from pycord.exceptions import AuthenticationError, GatewayError
 from pycord.gateway.codes import Opcodes
+from pycord.helpers import load_json
 
 import trio
 import trio_websocket
@@ -267,8 +268,9 @@ class TrioGateway(Gateway):
             self.buffer.extend(msg)
             if len(msg) < 4 or msg[-4:] != self.ZLIB_SUFFIX:
                 continue
-            loaded = json.loads(self.deflator.decompress(self.buffer).decode())
-            self.buffer = bytearray()
+            # Every json library we use reads utf-8 bytes directly, so skip building an intermediate str
+            loaded = load_json(self.deflator.decompress(self.buffer))
+            self.buffer.clear()
             print("GOT:", loaded)
             return loaded
 
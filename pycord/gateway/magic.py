@@ -1,6 +1,7 @@
 from functools import wraps
 from inspect import isclass
 from trio import run
+from types import MemberDescriptorType
 
 import pycord.config
 from pycord.exceptions import NoContextAvailable
@@ -69,6 +70,50 @@ def insert_context(**contexts):
     return func_wrapper
 
 
+class _ContextField:
+    """
+    Sends reads of a field on a model class through the context lookup
+
+    This is set on the metaclass instead of the model, so only reads on the class itself come here, and only for names
+    that are fields. Reading anything else on a model class, or anything at all on an instance, never calls python code.
+    Fields stored in __slots__ leave a member descriptor on the class, those are skipped in favour of the context. Other
+    class attributes with the same name, like a property on another model, are looked up as normal.
+
+    :ivar name: The name of the field
+    :vartype name: str
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, cls, metacls=None):
+        for klass in cls.__mro__:
+            if self.name in klass.__dict__:
+                value = klass.__dict__[self.name]
+                if type(value) is MemberDescriptorType:
+                    return ModelMagic._context_attr(cls, self.name)
+                get = getattr(type(value), '__get__', None)
+                return value if get is None else get(value, None, cls)
+        return ModelMagic._context_attr(cls, self.name)
+
+    def __set__(self, cls, value):
+        # Setting a class attribute with the same name as a field, like a flag property, has to skip this descriptor
+        delattr(ModelMagic, self.name)
+        try:
+            setattr(cls, self.name, value)
+        finally:
+            setattr(ModelMagic, self.name, self)
+
+    def __delete__(self, cls):
+        delattr(ModelMagic, self.name)
+        try:
+            delattr(cls, self.name)
+        finally:
+            setattr(ModelMagic, self.name, self)
+
+
 class ModelMagic(type):
     """
     A metaclass to make contexts work, like magic
@@ -78,10 +123,18 @@ class ModelMagic(type):
     class at run time, and the same with parent classes. At least not without great pain.
     """
 
-    def __getattr__(cls, item):
-        if item in dir(cls):
-            return super().__getattribute__(item)
+    def __init__(cls, name, bases, namespace, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # Annotations can't be resolved until the client fills pycord.config, but the names are all we need here
+        cls._has_id = any('id' in obj.__dict__.get('__annotations__', {}) for obj in cls.__mro__)
+        # Fields have to go through the context lookup when read on the class, see _ContextField
+        fields = [item for item, value in cls.__dict__.items() if type(value) is MemberDescriptorType]
+        fields.extend(cls.__dict__.get('__annotations__', ()))
+        for item in fields:
+            if not hasattr(type, item) and not isinstance(ModelMagic.__dict__.get(item), _ContextField):
+                setattr(ModelMagic, item, _ContextField(item))
 
+    def _context_attr(cls, item):
         try:
             info = pycord.config.event.get().get(cls.__name__)
         except LookupError:
@@ -98,6 +151,5 @@ class ModelMagic(type):
                     info['data'] = run(cls.get(*info['data']))
                     return getattr(cls, item)
 
-
         raise AttributeError("'{0}' object has no attribute '{1}' (Model doesn't support contexts in this"
                              "event)".format(cls.__name__, item))
@@ -1,4 +1,35 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
+try:
+    from orjson import loads as load_json
+except ModuleNotFoundError:
+    try:
+        from ujson import loads as load_json
+    except ModuleNotFoundError:
+        from json import loads as load_json
+
+# Set this to False if your bot mostly sees timestamps it has never seen before, so they aren't cached for nothing
+PARSE_TIMESTAMP_CACHE = True
+
+# Discord sends UTC timestamps, so there's only ever a handful of offsets. Keep one timedelta per offset around
+_UTC_OFFSETS = {"+00:00": None, "-00:00": None}
+
+
+def _utc_offset(offset: str):
+    """
+    Get the difference between a timestamp's offset and UTC
+
+    :param offset: The offset at the end of an ISO8601 timestamp, like +05:30
+    :type offset: str
+    :return: The difference, or None if the offset is UTC
+    :rtype: Optional[datetime.timedelta]
+    """
+    try:
+        return _UTC_OFFSETS[offset]
+    except KeyError:
+        minutes = int(offset[1:3]) * 60 + int(offset[4:6])
+        delta = _UTC_OFFSETS[offset] = timedelta(minutes=-minutes if offset[0] == "-" else minutes)
+        return delta
 
 
 def parse_timestamp(timestamp: str):
@@ -6,14 +37,48 @@ def parse_timestamp(timestamp: str):
     Parse a timestamp returned by discord
 
     This is not a reliable method at all, and if you need an accurate and safe way to read properties that use this
-    function, it is advised that you checkout the dateutil or arrow libraries for that.
+    function, it is advised that you checkout the dateutil or arrow libraries for that. Results are cached, because
+    the same timestamps tend to be parsed over and over again (members joining, messages being edited, etc), unless
+    :py:data:`~pycord.helpers.PARSE_TIMESTAMP_CACHE` is False. The returned datetime is naive and in UTC.
 
     :param timestamp: An ISO8601 timestamp
     :type timestamp: str
     :return: A parsed datetime object with the corresponding values
     :rtype: datetime.datetime
     """
-    return datetime.strptime(timestamp[:-6], "%Y-%m-%dT%H:%M:%S.%f")
+    if PARSE_TIMESTAMP_CACHE:
+        return _cached_parse_timestamp(timestamp)
+    return _parse_timestamp(timestamp)
+
+
+def _parse_timestamp(timestamp: str):
+    # Discord always sends the same shape, YYYY-MM-DDTHH:MM:SS[.ffffff]+00:00, so read the digits straight out of it
+    if len(timestamp) == 32 and timestamp[19] == ".":
+        parsed = datetime(
+            int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]), int(timestamp[20:26])
+        )
+    elif len(timestamp) == 25 and timestamp[19] in "+-":
+        parsed = datetime(
+            int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+        )
+    else:
+        # Anything else, like a shorter fraction of a second, goes through the builtin ISO8601 parser
+        try:
+            parsed = datetime.fromisoformat(timestamp)
+        except ValueError:
+            # Older pythons only read fractions of exactly 3 or 6 digits
+            parsed = datetime.strptime(timestamp[:-6], "%Y-%m-%dT%H:%M:%S.%f")
+        else:
+            offset = parsed.utcoffset()
+            parsed = parsed.replace(tzinfo=None)
+            return parsed - offset if offset else parsed
+    offset = _utc_offset(timestamp[-6:])
+    return parsed - offset if offset is not None else parsed
+
+
+_cached_parse_timestamp = lru_cache(maxsize=2 ** 16)(_parse_timestamp)
 
 def prefix(start_text: str):
     """
@@ -48,7 +113,8 @@ def mention_or(start_text: str):
     def checker(msg):
         if msg.content.startswith(msg.d_client.user.mention):
             return len(msg.d_client.user.mention)
-        if msg.content.startswith("<@!{0}>".format(msg.d_client.user.id)):
-            return len("<@!{0}>".format(msg.d_client.user.id))
+        nick_mention = f"<@!{msg.d_client.user.id}>"
+        if msg.content.startswith(nick_mention):
+            return len(nick_mention)
         return check_prefix(start_text)
     return checker
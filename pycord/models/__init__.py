@@ -1,4 +1,4 @@
-from .base import comboproperty, Model
+from .base import cached_comboproperty, comboproperty, LazyList, LookupEnum, Model, warmup
 from .channel import Channel, ChannelTypes, Overwrites
 from .emoji import Emoji
 from .gateway import Activity, ActivityAssets, ActivityParty, ActivityTimestamps, ActivitySecrets, PresenceUpdate
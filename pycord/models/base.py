@@ -1,9 +1,525 @@
-from inspect import getmro, isclass
-import functools
-from typing import Any, Dict, _GenericAlias, get_type_hints
+from collections.abc import Sequence
+from copy import deepcopy
+from enum import Enum
+from functools import lru_cache
+from inspect import isclass
+import linecache
+from sys import intern
+from typing import Any, Dict, Union, get_args, get_origin, get_type_hints
+from weakref import KeyedRef
 
 from pycord.exceptions import InvalidModel
 from pycord.gateway.magic import ModelMagic
+from pycord.helpers import load_json
+from .snowflake import Snowflake
+
+_SENTINEL = object()
+
+
+@lru_cache(maxsize=4096)
+def _dedupe(value: str):
+    # lru_cache hands back the first equal string it was given. Unlike sys.intern, it only keeps the most recently used
+    # ones, so it's safe for values that aren't bounded, like role names.
+    return value
+
+
+def _unwrap_optional(hint):
+    # Optional[X] is just Union[X, None], and None values never make it to a loader
+    if get_origin(hint) is Union:
+        return next(arg for arg in get_args(hint) if arg is not type(None))
+    return hint
+
+
+def _loader_source(hint, value: str, namespace: Dict[str, Any], depth: int = 0, interned: bool = False,
+                   deduped: bool = False):
+    """
+    Build the python expression that turns a value from the API into the annotated type
+
+    Any classes needed by the expression are bound into namespace, so the generated code can look them up as globals.
+
+    :param hint: The resolved annotation of the field
+    :type hint: Any
+    :param value: The name of the variable holding the API value
+    :type value: str
+    :param namespace: The globals the generated code will be executed with
+    :type namespace: Dict[str, Any]
+    :param depth: How many containers deep this value is, used to keep comprehension variables apart
+    :type depth: int
+    :param interned: If True, strings will be interned with sys.intern
+    :type interned: bool
+    :param deduped: If True, equal strings will share one object through a size-limited cache
+    :type deduped: bool
+    :return: A python expression
+    :rtype: str
+    """
+    hint = _unwrap_optional(hint)
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin is list:
+        item = "i{0}".format(depth)
+        loader = _loader_source(args[0], item, namespace, depth + 1, interned, deduped)
+        if loader == item:
+            return "list({0})".format(value)
+        return "[{0} for {1} in {2}]".format(loader, item, value)
+    elif origin is dict:
+        key, item = "k{0}".format(depth), "i{0}".format(depth)
+        return "{{{0}: {1} for {2}, {3} in {4}.items()}}".format(
+            _loader_source(args[0], key, namespace, depth + 1), _loader_source(args[1], item, namespace, depth + 1),
+            key, item, value
+        )
+    elif hint is type(None):
+        # The annotation was looked up before the client filled in pycord.config
+        raise InvalidModel("A model annotation resolved to None, was pycord.config set up by a client?")
+    elif interned and hint is str:
+        namespace["_intern"] = intern
+        return "_intern({0})".format(value)
+    elif deduped and hint is str:
+        namespace["_dedupe"] = _dedupe
+        return "_dedupe({0})".format(value)
+    elif hint is str or hint is bool:
+        # JSON already hands these over as the right type, so there's nothing to convert
+        return value
+
+    # Types can provide a faster way to build themselves from API values, see Snowflake
+    if isclass(hint) and "_d_load" in hint.__dict__:
+        load = hint.__dict__["_d_load"]
+    else:
+        load = hint
+    for name, obj in namespace.items():
+        if obj is load:
+            break
+    else:
+        name = "_T{0}".format(len(namespace))
+        namespace[name] = load
+    if isclass(hint) and issubclass(hint, Model):
+        return "{0}(client, {1})".format(name, value)
+    return "{0}({1})".format(name, value)
+
+
+def _generate_new(cls):
+    """
+    Generate the __new__ used by models with _reuse_instances, which reuses a model built from the same data if it's alive
+
+    Models are looked up by the values of the fields in their _reuse_key, or all their annotated fields (including
+    inherited ones) if it's None, so every one of those needs to be hashable. The key can also hold functions, which
+    are called with the data and return a hashable value, for fields that aren't hashable themselves. Like the generated __init__, the lookup is
+    written out for the model's fields instead of looping over them. Only weak references are kept, so a model is
+    forgotten as soon as nothing else uses it. The generated __init__ returns straight away for a model that's already
+    been built.
+
+    :param cls: The model to generate __new__ for
+    :type cls: Type[:py:class:`~pycord.models.base.Model`]
+    :return: A function that can be used as the model's __new__
+    :rtype: Callable
+    """
+    fields = cls._reuse_key or dict.fromkeys(
+        # __annotations__ only has the class's own fields, a subclass has to be told apart by the inherited ones too
+        name for klass in reversed(cls.__mro__) for name in klass.__dict__.get("__annotations__", ())
+    )
+    refs = {}
+
+    def forget(ref):
+        # Only drop the entry if it hasn't been replaced by a newer model with the same key
+        if refs.get(ref.key) is ref:
+            del refs[ref.key]
+
+    namespace = {"_refs": refs, "_forget": forget, "_KeyedRef": KeyedRef, "_object_new": object.__new__}
+    parts = []
+    for field in fields:
+        if callable(field):
+            name = "_k{0}".format(len(parts))
+            namespace[name] = field
+            parts.append("{0}(data)".format(name))
+        else:
+            parts.append("get({0!r})".format(field))
+    lines = [
+        "def __new__(cls, client=None, data=None):",
+        "    if data is None:",
+        "        # Called without data by copy and pickle, which fill in the fields themselves",
+        "        return _object_new(cls)",
+        "    get = data.get",
+        "    key = (client, {0})".format(", ".join(parts)),
+        "    ref = _refs.get(key)",
+        "    if ref is not None:",
+        "        model = ref()",
+        "        if model is not None:",
+        "            return model",
+        "    model = _object_new(cls)",
+        "    _refs[key] = _KeyedRef(model, _forget, key)",
+        "    return model",
+    ]
+    source = "\n".join(lines) + "\n"
+    filename = "<pycord generated {0}.__new__>".format(cls.__qualname__)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), namespace)
+    new = namespace["__new__"]
+    new.__qualname__ = "{0}.__new__".format(cls.__qualname__)
+    new._d_generated = True
+    return new
+
+
+def _unshared_new(cls, *args, **kwargs):
+    """
+    Used as __new__ by models that turn _reuse_instances back off after a parent model turned it on
+
+    object.__new__ can't be put back once a parent has replaced it, since it then refuses the model's arguments.
+
+    :param cls: The model to build
+    :type cls: Type[:py:class:`~pycord.models.base.Model`]
+    :return: A new instance of the model
+    :rtype: :py:class:`~pycord.models.base.Model`
+    """
+    return object.__new__(cls)
+
+
+def _generate_init(cls):
+    """
+    Generate an __init__ made specifically for a model's fields
+
+    Instead of looping over the annotations every time a model is created, this writes out the assignments for every
+    field once and compiles them into a normal function. pycord.config is only filled once the client is set up, so
+    this can't be done when the class is defined. It's done the first time the model is created instead.
+
+    :param cls: The model to generate the constructor for
+    :type cls: Type[:py:class:`~pycord.models.base.Model`]
+    :return: A function that can be used as the model's __init__
+    :rtype: Callable
+    """
+    namespace = {"_cls": cls, "_Model": Model}
+    loaders = []
+    lines = [
+        "def __init__(self, client, data):",
+        "    if self.__class__ is not _cls:",
+        "        # Called through super() by a subclass with its own __init__",
+        "        return _Model.__init__(self, client, data)",
+        "    self.d_data = data",
+        "    self.d_client = client",
+        "    get = data.get",
+    ]
+    if cls._reuse_instances:
+        # __new__ may hand back a model that was already built from the same data. d_client is set last, so a model
+        # that failed half way through being built isn't mistaken for a finished one.
+        lines[-3:-1] = [
+            "    if hasattr(self, 'd_client'):",
+            "        return",
+            "    self.d_data = data",
+        ]
+    # Resolve the annotations once, and keep them around for anything else that needs the field types
+    cls._resolved_hints = get_type_hints(cls)
+    flags = cls._flag_fields
+    lazy = []
+    for name, hint in cls._resolved_hints.items():
+        if name in flags:
+            continue
+        interned = name in cls._intern_fields
+        deduped = name in cls._dedupe_fields
+        if name in cls._deferred_fields:
+            # Keep the list the API sent, and only turn it into models once it's actually used. The item loader is made
+            # once for the model, instead of a new closure for every instance.
+            namespace["_LazyList"] = LazyList
+            item_hint = get_args(_unwrap_optional(hint))[0]
+            loaders.append("def _item_{0}(client, i0):".format(name))
+            loaders.append("    return {0}".format(_loader_source(item_hint, "i0", namespace, 1, interned, deduped)))
+            lines.append("    v = get({0!r})".format(name))
+            lines.append(
+                "    self.{0} = _LazyList(v, _item_{0}, client) if v else (None if v is None else [])".format(name)
+            )
+            continue
+        loader = _loader_source(hint, "v", namespace, interned=interned, deduped=deduped)
+        if name in cls._lazy_fields:
+            # Only keep what the API sent, the property made below builds it when it's first used
+            lazy.append(name)
+            lines.append("    self._{0}_raw = get({1!r})".format(name.lstrip("_"), name))
+            loaders.append("def _load_{0}(client, v):".format(name))
+            loaders.append("    return {0} if v is not None else None".format(loader))
+        elif loader == "v":
+            lines.append("    self.{0} = get({0!r})".format(name))
+        else:
+            lines.append("    v = get({0!r})".format(name))
+            lines.append("    self.{0} = {1} if v is not None else None".format(name, loader))
+    if flags:
+        lines.append("    self._flags = {0}".format(" | ".join(
+            "({0} if get({1!r}) else 0)".format(1 << bit, name) for bit, name in enumerate(flags)
+        )))
+    if cls._reuse_instances:
+        lines.append("    self.d_client = client")
+
+    source = "\n".join(lines + loaders) + "\n"
+    filename = "<pycord generated {0}.__init__>".format(cls.__qualname__)
+    # Let tracebacks and debuggers show the generated code, for example when a field fails to load
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = "{0}.__init__".format(cls.__qualname__)
+    for name in lazy:
+        setattr(cls, name, _lazy_property(name, namespace["_load_{0}".format(name)]))
+    init._d_generated = True
+    return init
+
+
+def _dump_source(hint, value: str, depth: int = 0):
+    """
+    Build the python expression that turns a field's value back into what the API would send
+
+    :param hint: The resolved annotation of the field
+    :type hint: Any
+    :param value: The name of the variable holding the field's value
+    :type value: str
+    :param depth: How many containers deep this value is, used to keep comprehension variables apart
+    :type depth: int
+    :return: A python expression
+    :rtype: str
+    """
+    hint = _unwrap_optional(hint)
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin is list:
+        item = "i{0}".format(depth)
+        dump = _dump_source(args[0], item, depth + 1)
+        if dump == item:
+            return "list({0})".format(value)
+        return "[{0} for {1} in {2}]".format(dump, item, value)
+    elif origin is dict:
+        key, item = "k{0}".format(depth), "i{0}".format(depth)
+        return "{{{0}: {1} for {2}, {3} in {4}.items()}}".format(
+            _dump_source(args[0], key, depth + 1), _dump_source(args[1], item, depth + 1), key, item, value
+        )
+    elif isclass(hint) and issubclass(hint, Model):
+        return "{0}.to_dict()".format(value)
+    elif isclass(hint) and issubclass(hint, Snowflake):
+        # Discord sends IDs as strings, since they don't fit in a javascript number
+        return "str({0})".format(value)
+    return value
+
+
+def _generate_to_dict(cls):
+    """
+    Generate a to_dict made specifically for a model's fields
+
+    Like the generated __init__, this writes out every field once instead of looping over the annotations. Fields that
+    are only built when they're used are dumped like any other field if they've been built already, otherwise a deep
+    copy of the API's data is used, so calling this won't build them and won't hand out the model's own data.
+
+    :param cls: The model to generate to_dict for
+    :type cls: Type[:py:class:`~pycord.models.base.Model`]
+    :return: A function that can be used as the model's to_dict
+    :rtype: Callable
+    """
+    lines = [
+        "def to_dict(self):",
+        "    out = {}",
+    ]
+    namespace = {"_SENTINEL": _SENTINEL, "_deepcopy": deepcopy}
+    helpers = []
+    flags = cls._flag_fields
+    for name, hint in cls._resolved_hints.items():
+        if name in flags:
+            lines.append("    out[{0!r}] = bool(self._flags & {1})".format(name, 1 << flags.index(name)))
+            continue
+        if name in cls._lazy_fields:
+            prop = next(vars(klass)[name] for klass in cls.__mro__ if name in vars(klass))
+            namespace["_cached_" + name] = prop.cached
+            lines.append("    v = _cached_{0}(self, _SENTINEL)".format(name))
+            lines.append("    if v is _SENTINEL:")
+            lines.append("        v = self._{0}_raw".format(name.lstrip("_")))
+            lines.append("        if v is not None:")
+            lines.append("            out[{0!r}] = _deepcopy(v)".format(name))
+            lines.append("    elif v is not None:")
+            lines.append("        out[{0!r}] = {1}".format(name, _dump_source(hint, "v")))
+            continue
+        if name in cls._deferred_fields:
+            item_hint = get_args(_unwrap_optional(hint))[0]
+            helpers.append("def _dump_{0}(i0):".format(name))
+            helpers.append("    return {0}".format(_dump_source(item_hint, "i0", 1)))
+            lines.append("    v = self.{0}".format(name))
+            dump = "v._dump(_dump_{0}) if v else []".format(name)
+        else:
+            lines.append("    v = self.{0}".format(name))
+            dump = _dump_source(hint, "v")
+        lines.append("    if v is not None:")
+        lines.append("        out[{0!r}] = {1}".format(name, dump))
+    lines.append("    return out")
+
+    source = "\n".join(helpers + lines) + "\n"
+    filename = "<pycord generated {0}.to_dict>".format(cls.__qualname__)
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = "{0}.to_dict".format(cls.__qualname__)
+    to_dict._d_generated = True
+    return to_dict
+
+
+def _flag_property(mask: int):
+    """
+    Make a property that reads one of the bits a model packed into its _flags
+
+    :param mask: The bit of _flags the property reads
+    :type mask: int
+    :return: A property that's True if the bit is set
+    :rtype: :py:class:`~pycord.models.base.comboproperty`
+    """
+    return comboproperty(lambda self: bool(self._flags & mask))
+
+
+def _lazy_property(name: str, load):
+    """
+    Make a property that builds a field from the data the API sent the first time it's used
+
+    :param name: The name of the field
+    :type name: str
+    :param load: A function that takes the client and the API value, and returns the field's value
+    :type load: Callable
+    :return: A cached property for the field
+    :rtype: :py:class:`~pycord.models.base.cached_comboproperty`
+    """
+    raw = "_{0}_raw".format(name.lstrip("_"))
+
+    def fget(self):
+        return load(self.d_client, getattr(self, raw))
+    fget.__name__ = name
+    return cached_comboproperty(fget)
+
+
+def _install_init(cls):
+    """
+    Generate a model's __init__, and use it for the model from now on
+
+    :param cls: The model to generate the constructor for
+    :type cls: Type[:py:class:`~pycord.models.base.Model`]
+    :return: The generated __init__
+    :rtype: Callable
+    """
+    if not hasattr(cls, "__annotations__"):
+        raise InvalidModel("Model doesn't contain any annotations")
+    init = cls._d_init = _generate_init(cls)
+    if cls.__init__ is Model.__init__:
+        # Skip Model.__init__ entirely from now on, unless the model has its own __init__
+        cls.__init__ = init
+    return init
+
+
+def warmup(*models):
+    """
+    Get models ready to be created before any events come in
+
+    Normally a model's constructor is generated the first time the model is created, which makes the first few events
+    slower than the rest. This does it ahead of time instead, it's called by the client once pycord.config is set up.
+    Anything that isn't a model is ignored, so all the values in the config can just be passed in.
+
+    :param models: The models to prepare
+    :type models: Type[:py:class:`~pycord.models.base.Model`]
+    :return: Nothing
+    """
+    for model in models:
+        if isclass(model) and issubclass(model, Model) and "_d_init" not in model.__dict__:
+            _install_init(model)
+
+
+class LazyList(Sequence):
+    """
+    A read-only list of models that aren't created until they're used
+
+    Some payloads, like the member list of a large guild, are huge, and most bots only look at a small part of them (if
+    they look at all). Models can list fields in _deferred_fields to have them stored as a LazyList. The list keeps
+    the data from the API as is, and only creates a model the first time it's item is accessed. Getting the length of
+    the list doesn't create anything. Empty lists from the API are stored as a plain empty list instead.
+
+    :ivar _raw: The list of dicts returned by the API
+    :vartype _raw: List[Dict[str, Any]]
+    :ivar _load: A function that takes the client and one item from the API, and turns it into a model. It's made once
+    per model class, so creating the list doesn't allocate anything else.
+    :vartype _load: Callable
+    :ivar _client: The client the models are created for
+    :vartype _client: :py:class:`~pycord.client.client.Client`
+    :ivar _items: The created models, with a placeholder for models that haven't been created yet
+    :vartype _items: Optional[List[Any]]
+    """
+
+    __slots__ = ('_raw', '_load', '_client', '_items')
+
+    def __init__(self, raw: list, load, client):
+        self._raw = raw
+        self._load = load
+        self._client = client
+        self._items = None
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        if self._items is None:
+            self._items = [_SENTINEL] * len(self._raw)
+        item = self._items[index]
+        if item is _SENTINEL:
+            item = self._items[index] = self._load(self._client, self._raw[index])
+        return item
+
+    def __iter__(self):
+        for index in range(len(self._raw)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, LazyList):
+            other = list(other)
+        return list(self) == other
+
+    def __repr__(self):
+        return "LazyList({0!r})".format(list(self))
+
+    def created(self, index: int, default=None):
+        """
+        Get an item only if it's model has been created already
+
+        :param index: The index of the item
+        :type index: int
+        :param default: What to return if the model hasn't been created yet
+        :type default: Any
+        :return: The model, or default
+        :rtype: Any
+        """
+        if self._items is None:
+            return default
+        item = self._items[index]
+        return default if item is _SENTINEL else item
+
+    def _dump(self, dump):
+        """
+        Turn the list back into what the API would send, without creating any models
+
+        :param dump: A function that turns one created model back into what the API would send
+        :type dump: Callable
+        :return: The dumped items, with a deep copy of the API's data for items that haven't been created
+        :rtype: List[Any]
+        """
+        if self._items is None:
+            return deepcopy(self._raw)
+        return [deepcopy(raw) if item is _SENTINEL else dump(item) for item, raw in zip(self._items, self._raw)]
+
+
+class LookupEnum(Enum):
+    """
+    An enum that can find its members by value without going through Enum's constructor
+
+    Calling an enum with a value it doesn't have raises a ValueError, and even a hit goes through a fair bit of
+    machinery. Models read enums from values sent by discord, which may be new, so this just returns a default instead.
+    """
+
+    @classmethod
+    def from_value(cls, value, default=None):
+        """
+        Get the member of the enum with the value
+
+        :param value: The value of the member
+        :type value: Any
+        :param default: What to return if there's no member with that value
+        :type default: Any
+        :return: The member, or default
+        :rtype: Any
+        """
+        return cls._value2member_map_.get(value, default)
 
 
 class comboproperty:
@@ -18,11 +534,70 @@ class comboproperty:
     :vartype fget: Callable
     """
 
+    __slots__ = ('fget',)
+
     def __init__(self, fget):
         self.fget = fget
 
     def __get__(self, obj=None, objtype=None):
-        return self.fget.__get__(obj if obj else objtype, objtype)()
+        return self.fget(obj if obj is not None else objtype)
+
+
+class cached_comboproperty(comboproperty):
+    """
+    A comboproperty that only calls it's function once per instance
+
+    The first time this is accessed on an instance, the result is stored in the instance's __dict__ under the same
+    name, so every access after that is a normal attribute lookup. Models that use __slots__ don't have a __dict__, so
+    they need to reserve a slot named ``_<name>_cache`` for it instead. Later accesses still go through this
+    descriptor, which reads that slot. Only use this for values that can't change, like a mention. Accessing it on the
+    class will still call the function every time, so contexts keep working.
+
+    :ivar name: The name of the attribute the result is stored under.
+    :vartype name: str
+    :ivar cache: The name of the slot the result is stored under, for models using __slots__.
+    :vartype cache: str
+    """
+
+    __slots__ = ('name', 'cache')
+
+    def __init__(self, fget):
+        super().__init__(fget)
+        self.__set_name__(None, fget.__name__)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.cache = "_{0}_cache".format(name.lstrip("_"))
+
+    def cached(self, obj, default=None):
+        """
+        Get the result stored on an instance, without working it out if it hasn't been yet
+
+        :param obj: The instance to look at
+        :type obj: Any
+        :param default: What to return if the result hasn't been worked out yet
+        :type default: Any
+        :return: The stored result, or default
+        :rtype: Any
+        """
+        try:
+            return getattr(obj, self.cache)
+        except AttributeError:
+            return getattr(obj, "__dict__", {}).get(self.name, default)
+
+    def __get__(self, obj=None, objtype=None):
+        if obj is None:
+            return self.fget(objtype)
+        try:
+            return getattr(obj, self.cache)
+        except AttributeError:
+            pass
+        value = self.fget(obj)
+        try:
+            obj.__dict__[self.name] = value
+        except AttributeError:
+            setattr(obj, self.cache, value)
+        return value
 
 
 class Model(metaclass=ModelMagic):
@@ -34,14 +609,40 @@ class Model(metaclass=ModelMagic):
     set each individual one in the config. Keep in mind when using a discord object, PyCharm or other editors may not
     auto-suggest attribute names because they're generated dynamically. As a side note, all models that have an ID
     attribute can be used in `==` operations with other objects with an ID. Also, if it has an ID, the hash is equal to
-    that ID.
+    the hash of that ID.
 
     :ivar d_data: The original information passed in.
     :type d_data: Dict[str, Any]
     :ivar d_client: The client the object belongs too.
     :type d_client: :py:class:`~pycord.client.client.Client`
+    :cvar _resolved_hints: The model's annotations with pycord.config references filled in. Only set once the first
+    instance of the model has been created.
+    :vartype _resolved_hints: Dict[str, Any]
     """
 
+    __slots__ = ('d_data', 'd_client')
+
+    # Names of string fields that only ever hold a handful of values, like a status. These are interned so the same
+    # few strings get reused by every model instead of being allocated again for each event.
+    _intern_fields = ()
+    # Names of string fields that often repeat, but can hold anything, like a role name. Interning those would keep
+    # every value alive forever on some python versions, so they share strings through a size-limited cache instead.
+    _dedupe_fields = ()
+    # Names of list fields that should be stored as a LazyList, see LazyList
+    _deferred_fields = ()
+    # Names of fields that are only built the first time they're used. The API value is kept in a slot named
+    # _<name>_raw, and the built value in _<name>_cache, see cached_comboproperty
+    _lazy_fields = ()
+    # Names of bool fields that are packed into the bits of a single int slot named _flags. Each one is read back
+    # through a property, and a missing value reads as False.
+    _flag_fields = ()
+    # If True, creating the model reuses an existing instance built from the same field values instead of making a new
+    # one. Only for models that are never changed after being created, and need '__weakref__' in their __slots__.
+    _reuse_instances = False
+    # Names of the fields that decide if two models were built from the same data, None means every annotated field.
+    # Functions taking the data can be used alongside the names, for fields that aren't hashable.
+    _reuse_key = None
+
     def __init__(self, client, data: Dict[str, Any]):
         """
         Constructor for Model, very rare should this be called manually.
@@ -54,58 +655,74 @@ class Model(metaclass=ModelMagic):
         :param data: A dict returned by the discord API
         :type data: Dict[str, Any]
         """
-        if not hasattr(self.__class__, "__annotations__"):
-            raise InvalidModel("Model doesn't contain any annotations")
-
-        self.d_data = data
-        self.d_client = client
-
-        annotations = {}
-        for obj in getmro(self.__class__):
-            if hasattr(obj, "__annotations__"):
-                annotations.update(get_type_hints(obj))
-
-        for name, value in annotations.items():
-            api_val = data.get(name)
-            if api_val is None:
-                setattr(self, name, None)
-                continue
-            if hasattr(value, "_name") and value._name is None:
-                value = value.__args__[0]
-            loaded = self._load(value)
-            setattr(self, name, loaded(api_val))
-
-    def _get_val(self, name):
-        api_value = self.d_data.get(name)
-        if api_value is None:
-            raise InvalidModel("Data received didn't fulfill object requirements.")
-        return api_value
-
-    def _load(self, value):
-        if isclass(value):
-            if issubclass(value, Model):
-                return lambda x: value(self.d_client, x)
-            return value
-        else:
-            if value._name == "List":
-                return lambda x: [self._load(value.__args__[0])(v) for v in x]
-            elif value._name == "Dict":
-                return lambda x: {self._load(value.__args__[0])(i): self._load(value.__args__[1])(m)
-                                  for i, m in x.items()}
-            else:
-                pass
+        cls = self.__class__
+        init = cls.__dict__.get("_d_init")
+        if init is None:
+            init = _install_init(cls)
+        init(self, client, data)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Generated constructors only know their own model's fields, so they can't be inherited
+        if cls.__init__ is Model.__init__ or getattr(cls.__init__, "_d_generated", False):
+            cls.__init__ = Model.__init__
+        if getattr(cls.to_dict, "_d_generated", False):
+            cls.to_dict = Model.to_dict
+        for bit, name in enumerate(cls.__dict__.get("_flag_fields", ())):
+            setattr(cls, name, _flag_property(1 << bit))
+        if cls._reuse_instances and ("__new__" not in cls.__dict__ or getattr(cls.__new__, "_d_generated", False)):
+            # Each model gets its own, since the lookup is written out for it's fields
+            cls.__new__ = staticmethod(_generate_new(cls))
+        elif not cls._reuse_instances and getattr(cls.__new__, "_d_generated", False):
+            # Without this, a subclass turning it off would still reuse instances, and re-initialise them in place
+            cls.__new__ = staticmethod(_unshared_new)
+
+    @classmethod
+    def from_raw(cls, client, raw: Union[bytes, str]):
+        """
+        Create the model from a JSON payload that hasn't been decoded yet
+
+        The payload is decoded with orjson or ujson when they're installed, falling back to the builtin json module. If
+        the payload is a list, like the one returned when fetching voice regions, a model is created for every item. If
+        the model reuses instances, an existing one built from the same data may be returned.
+
+        :param client: The client object the class was created for.
+        :type client: :py:class:`~pycord.client.client.Client`
+        :param raw: The JSON returned by the discord API
+        :type raw: Union[bytes, str]
+        :return: An instance of the model, or a list of them
+        :rtype: Union[:py:class:`~pycord.models.base.Model`, List[:py:class:`~pycord.models.base.Model`]]
+        """
+        data = load_json(raw)
+        if isinstance(data, list):
+            return [cls(client, item) for item in data]
+        return cls(client, data)
+
+    def to_dict(self):
+        """
+        Turn the model back into a dict, like the one the API sent
+
+        Fields that are None are left out. The function doing the work is generated for each model the first time it's
+        used, the same way the model's constructor is.
+
+        :return: The model's fields
+        :rtype: Dict[str, Any]
+        """
+        cls = self.__class__
+        to_dict = cls.__dict__.get("_d_to_dict")
+        if to_dict is None:
+            to_dict = cls._d_to_dict = _generate_to_dict(cls)
+            if cls.to_dict is Model.to_dict:
+                cls.to_dict = to_dict
+        return to_dict(self)
 
     def __eq__(self, other):
-        if not hasattr(self, 'id'):
+        if not self._has_id:
             raise NotImplementedError("This object doesn't have an ID, therefor can't be compared.")
-        if not hasattr(other, 'id'):
-            return False
-        return self.id == other.id
+        return getattr(other, 'id', _SENTINEL) == self.id
 
     def __hash__(self):
-        if not hasattr(self, 'id'):
-            return super().__hash__()
-        return self.id
+        return hash(self.id) if self._has_id else object.__hash__(self)
 
     def get(self, *args):
         """
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from enum import Enum
 from typing import List, Optional
 
 import pycord.config
 from pycord.helpers import parse_timestamp
-from .base import comboproperty, Model
+from .base import comboproperty, LookupEnum, Model
 
 
 class Overwrites(Model):
@@ -24,13 +23,15 @@ class Overwrites(Model):
     :ivar deny: A bitset containing all the perms that are not allowed
     :vartype deny: int
     """
+    _intern_fields = ('type',)
+
     id: pycord.config.SNOWFLAKE
     type: str
     allow: int
     deny: int
 
 
-class ChannelTypes(Enum):
+class ChannelTypes(LookupEnum):
     """
     A list of channel types.
 
@@ -121,9 +122,7 @@ class Channel(Model):
 
     @comboproperty
     def channel_type(self):
-        for channel_type in ChannelTypes:
-            if channel_type.value == self.type:
-                return channel_type
+        return ChannelTypes.from_value(self.type)
 
     @comboproperty
     def last_pin_date(self):
@@ -42,5 +42,5 @@ class Emoji(Model):
         if not self.id:
             return self.name
         if self.animated:
-            return "<a:{name}:{emoji_id}>".format(name=self.name, emoji_id=self.id)
-        return "<{name}:{emoji_id}>".format(name=self.name, emoji_id=self.id)
+            return f"<a:{self.name}:{self.id}>"
+        return f"<{self.name}:{self.id}>"
@@ -1,13 +1,13 @@
+from __future__ import annotations
 from datetime import datetime
-from enum import Enum
 from typing import List, Optional
 
 import pycord.config
-from .base import comboproperty, Model
+from .base import comboproperty, LookupEnum, Model
 from pycord.helpers import parse_timestamp
 
 
-class ActivityType(Enum):
+class ActivityType(LookupEnum):
     """
     An enum with the different types of activities
 
@@ -161,9 +161,7 @@ class Activity(Model):
 
     @comboproperty
     def activity_type(self):
-        for activity in ActivityType:
-            if activity.value == self.type:
-                return activity
+        return ActivityType.from_value(self.type)
 
 
 class PresenceUpdate(Model):
@@ -186,6 +184,8 @@ class PresenceUpdate(Model):
     :ivar activities: A list of activities the user is currently undertaking
     :vartype activities: List[:py:class:`~pycord.models.gateway.Activity`]
     """
+    _intern_fields = ('status',)
+
     user: pycord.config.USER
     roles: List[pycord.config.SNOWFLAKE]
     game: Optional[pycord.config.ACTIVITY]
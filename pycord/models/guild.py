@@ -3,7 +3,10 @@ from typing import List, Optional
 
 import pycord.config
 from pycord.helpers import parse_timestamp
-from .base import comboproperty, Model
+from .base import cached_comboproperty, Model
+
+ICON_URL = "https://cdn.discordapp.com/icons/"
+SPLASH_URL = "https://cdn.discordapp.com/splashes/"
 
 
 class Role(Model):
@@ -31,6 +34,14 @@ class Role(Model):
     :ivar mention: A mention of the role, will provide even if it isn't mentionable
     :vartype mention: str
     """
+    __slots__ = (
+        'id', 'name', 'color', 'hoist', 'position', 'permissions', 'managed', 'mentioned', '_mention_cache', '__weakref__'
+    )
+    # Names like @everyone and Moderator repeat across guilds, but anyone can pick any name
+    _dedupe_fields = ('name',)
+    # The same roles show up again on every reconnect, so guilds share them
+    _reuse_instances = True
+
     id: pycord.config.SNOWFLAKE
     name: str
     color: int
@@ -40,9 +51,9 @@ class Role(Model):
     managed: bool
     mentioned: bool
 
-    @comboproperty
+    @cached_comboproperty
     def mention(self):
-        return "<@&{role_id}>".format(role_id=self.id)
+        return f"<@&{self.id}>"
 
 
 class Member(Model):
@@ -59,19 +70,26 @@ class Member(Model):
     :vartype nick: Optional[str]
     :ivar roles: A list of snowflakes linking to roles the member has
     :vartype roles: List[:py:class:`~pycord.models.snowflake.Snowflake`]
+    :ivar role_set: The member's role IDs as a set, for quick ``in`` checks and set operations
+    :vartype role_set: FrozenSet[:py:class:`~pycord.models.snowflake.Snowflake`]
     :ivar joined_at: An ISO8601 timestamp for when the user joined
     :vartype joined_at: str
-    :ivar join_date: A parsed version of the joined_at property
+    :ivar join_date: A parsed version of the joined_at property. If the member has already been created when it's
+    guild works out :py:attr:`~pycord.models.guild.Guild.member_join_dates`, the two share the same parsed date.
     :vartype join_date: datetime.datetime
     :ivar deaf: If True, the user can't hear the VC on the guild
     :vartype deaf: bool
     :ivar mute: If True, the user can't speak on the VC in the guild
     :vartype mute: bool
-    :ivar mention: Much like :py:attr:`~pycord.models.user.User.mention`, however this takes into account a user's nick
+    :ivar mention: Much like :py:attr:`~pycord.models.user.User.mention`, however this takes into account a user's nick.
+    It's cached after the first access.
     :vartype mention: str
     :ivar guild_id: The guild ID the member belongs to. Only available on events where a member does something like join
     :vartype guild_id: Optional[:py:class:`~pycord.models.snowflake.Snowflake`]
     """
+    __slots__ = ('user', 'nick', 'roles', 'joined_at', 'deaf', 'mute', 'guild_id', '_mention_cache', '_join_date_cache',
+                 '_role_set_cache')
+
     user: pycord.config.USER
     nick: Optional[str]
     roles: List[pycord.config.SNOWFLAKE]
@@ -80,17 +98,21 @@ class Member(Model):
     mute: bool
     guild_id: Optional[pycord.config.SNOWFLAKE]
 
-    @comboproperty
+    @cached_comboproperty
     def join_date(self):
         return parse_timestamp(self.joined_at)
 
-    @comboproperty
+    @cached_comboproperty
     def mention(self):
         if self.nick:
-            return "<@!{user_id}>".format(user_id=self.user.id)
+            return f"<@!{self.user.id}>"
         else:
             return self.user.mention
 
+    @cached_comboproperty
+    def role_set(self):
+        return frozenset(self.roles or ())
+
 
 class Guild(Model):
     """
@@ -134,10 +156,10 @@ class Guild(Model):
     :vartype default_message_notifications: int
     :ivar explicit_content_filter: If True, discord will remove naughty messages
     :vartype explicit_content_filter: int
-    :ivar roles: A list of roles on the guild
-    :vartype roles: List[:py:class:`~pycord.models.guild.Role`]
-    :ivar emojis: A list of emojis the guild has made
-    :vartype emojis: List[:py:class:`~pycord.models.emoji.Emoji`]
+    :ivar roles: A read-only list of roles on the guild
+    :vartype roles: :py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.guild.Role`]
+    :ivar emojis: A read-only list of emojis the guild has made
+    :vartype emojis: :py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.emoji.Emoji`]
     :ivar features: Enabled guild features, whatever that means
     :vartype features: List[str]
     :ivar mfa_level: If 1, you need to have 2fac to use some admin powers
@@ -160,15 +182,29 @@ class Guild(Model):
     :vartype unavailable: Optional[bool]
     :ivar member_count: An estimate towards the amount of people in the guild
     :vartype member_count: Optional[int]
-    :ivar voice_states: A list of information about the current people using voice chats
-    :vartype voice_states: Optional[List[:py:class:`~pycord.models.voice.VoiceState`]]
-    :ivar members: A list of the current members, may not be full depending on server size
-    :vartype mmebers: Optional[List[:py:class:`~pycord.models.guild.Memebr`]]
-    :ivar channels: A list of channels (text and voice) on the guild
-    :vartype channels: Optional[List[:py:class:`~pycord.models.channel.Channel`]]
-    :ivar presences: A list of presences for the people in the guild, may not be complete
-    :vartype presences: Optional[List[:py:class:`~pycord.models.gateway.PresenceUpdate`]]
+    :ivar voice_states: A read-only list of information about the current people using voice chats
+    :vartype voice_states: Optional[:py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.voice.VoiceState`]]
+    :ivar members: A read-only list of the current members, may not be full depending on server size
+    :vartype members: Optional[:py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.guild.Member`]]
+    :ivar channels: A read-only list of channels (text and voice) on the guild
+    :vartype channels: Optional[:py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.channel.Channel`]]
+    :ivar presences: A read-only list of presences for the people in the guild, may not be complete
+    :vartype presences: Optional[:py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.gateway.PresenceUpdate`]]
+    :ivar member_join_dates: The parsed join date of every member, in the same order as members. This doesn't create
+    any members, and members that have already been created share their join_date with it.
+    :vartype member_join_dates: List[datetime.datetime]
     """
+    __slots__ = (
+        'id', 'name', 'icon', 'splash', 'owner', 'owner_id', 'permissions', 'region', 'afk_channel_id', 'afk_timeout',
+        'embed_enabled', 'embed_channel_id', 'verification_level', 'default_message_notifications',
+        'explicit_content_filter', 'roles', 'emojis', 'features', 'mfa_level', 'application_id', 'widget_enabled',
+        'widget_channel_id', 'system_channel_id', 'joined_at', 'large', 'unavailable', 'member_count', 'voice_states',
+        'members', 'channels', 'presences', '_icon_url_cache', '_splash_url_cache', '_member_join_dates_cache',
+        '_role_positions_cache', '_joined_at_date_cache'
+    )
+    _intern_fields = ('region', 'features')
+    _deferred_fields = ('roles', 'emojis', 'voice_states', 'members', 'channels', 'presences')
+
     id: pycord.config.SNOWFLAKE
     name: str
     icon: Optional[str]
@@ -201,22 +237,69 @@ class Guild(Model):
     channels: Optional[List[pycord.config.CHANNEL]]
     presences: Optional[List[pycord.config.PRESENCE_UPDATE]]
 
-    @comboproperty
+    @cached_comboproperty
     def icon_url(self):
         if self.icon:
-            return "https://cdn.discordapp.com/icons/{guild_id}/{guild_icon}.png".format(
-                guild_id=self.id,
-                guild_icon=self.icon
-            )
+            return f"{ICON_URL}{self.id}/{self.icon}.png"
 
-    @comboproperty
+    @cached_comboproperty
     def splash_url(self):
         if self.splash:
-            return "https://cdn.discordapp.com/splashes/{guild_id}/{guild_splash}.png".format(
-                guild_id=self.id,
-                guild_splash=self.splash
-            )
+            return f"{SPLASH_URL}{self.id}/{self.splash}.png"
 
-    @comboproperty
+    @cached_comboproperty
     def joined_at_date(self):
         return parse_timestamp(self.joined_at) if self.joined_at else None
+
+    @cached_comboproperty
+    def member_join_dates(self):
+        # Large guilds have more members than parse_timestamp caches, so keep the parsed dates local to this pass
+        parsed = {}
+        dates = []
+        for index, data in enumerate(self.d_data.get('members') or ()):
+            member = self.members.created(index)
+            if member is not None and hasattr(member, '_join_date_cache'):
+                date = member._join_date_cache
+            else:
+                joined_at = data.get('joined_at')
+                date = parsed.get(joined_at)
+                if date is None and joined_at:
+                    date = parsed[joined_at] = parse_timestamp(joined_at)
+                if member is not None:
+                    member._join_date_cache = date
+            dates.append(date)
+        return dates
+
+    @cached_comboproperty
+    def _role_positions(self):
+        return {int(role['id']): index for index, role in enumerate(self.d_data.get('roles') or ())}
+
+    def role_by_id(self, role_id: int):
+        """
+        Find one of the guild's roles using it's ID
+
+        Only the role that was asked for is created, the rest of the roles are left alone until they're used.
+
+        :param role_id: The ID of the role
+        :type role_id: :py:class:`~pycord.models.snowflake.Snowflake`
+        :return: The role with that ID, None if the guild doesn't have it
+        :rtype: Optional[:py:class:`~pycord.models.guild.Role`]
+        """
+        index = self._role_positions.get(role_id)
+        return self.roles[index] if index is not None else None
+
+    def member_roles(self, member: "Member"):
+        """
+        Get the Role objects for every role a member has
+
+        Members only know the IDs of their roles, this looks each of them up with
+        :py:meth:`~pycord.models.guild.Guild.role_by_id`, so it only costs as much as the amount of roles the member
+        has, not the amount of roles in the guild. IDs of roles the guild doesn't have are skipped.
+
+        :param member: A member of this guild
+        :type member: :py:class:`~pycord.models.guild.Member`
+        :return: The member's roles
+        :rtype: List[:py:class:`~pycord.models.guild.Role`]
+        """
+        positions = self._role_positions
+        return [self.roles[positions[role_id]] for role_id in member.roles or () if role_id in positions]
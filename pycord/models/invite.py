@@ -23,11 +23,13 @@ class Invite(Model):
     :ivar approximate_member_count: The approximate amount of people actually in the server
     :vartype approximate_member_count: Optional[int]
     """
+    __slots__ = ('code', 'guild', 'channel', 'approximate_presence_count', 'approximate_member_count')
+
     code: str
     guild: Optional[pycord.config.GUILD]
     channel: Optional[pycord.config.CHANNEL]
-    approximate_presence_count = Optional[int]
-    approximate_member_count = Optional[int]
+    approximate_presence_count: Optional[int]
+    approximate_member_count: Optional[int]
 
 
 class InviteMetadata(Model):
@@ -55,6 +57,8 @@ class InviteMetadata(Model):
     :ivar revoked: If True, this invite has expired and can't be used
     :vartype revoked: bool
     """
+    __slots__ = ('inviter', 'uses', 'max_uses', 'max_age', 'temporary', 'created_at', 'revoked')
+
     inviter: pycord.config.USER
     uses: int
     max_uses: int
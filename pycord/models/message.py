@@ -1,13 +1,12 @@
 from __future__ import annotations
-from enum import Enum
 from typing import List, Optional
 
 import pycord.config
 from pycord.helpers import parse_timestamp
-from .base import comboproperty, Model
+from .base import cached_comboproperty, comboproperty, LookupEnum, Model
 
 
-class MessageTypes(Enum):
+class MessageTypes(LookupEnum):
     """
     An enum with all the different types of messages
 
@@ -42,7 +41,7 @@ class MessageTypes(Enum):
     GUILD_MEMBER_JOIN = 7
 
 
-class MessageActivityType(Enum):
+class MessageActivityType(LookupEnum):
     """
     An enum with all the different types of message activities
 
@@ -77,14 +76,14 @@ class MessageActivity(Model):
     :ivar party_id: The party_id will be used to allow discord to put you into the game
     :vartype party_id: Optional[str]
     """
+    __slots__ = ('type', 'party_id')
+
     type: int
     party_id: Optional[str]
 
     @comboproperty
     def activity_type(self):
-        for activity in MessageActivityType:
-            if activity.value == self.type:
-                return activity
+        return MessageActivityType.from_value(self.type)
 
 
 class MessageApplication(Model):
@@ -105,6 +104,8 @@ class MessageApplication(Model):
     :ivar name: The name of the message application
     :vartype name: str
     """
+    __slots__ = ('id', 'cover_image', 'description', 'icon', 'name')
+
     id: pycord.config.SNOWFLAKE
     cover_image: str
     description: str
@@ -133,6 +134,8 @@ class Attachment(Model):
     :ivar width: If the file is an image, this contains the width of the image
     :vartype width: Optional[int]
     """
+    __slots__ = ('id', 'filename', 'size', 'url', 'proxy_url', 'height', 'width')
+
     id: pycord.config.SNOWFLAKE
     filename: str
     size: int
@@ -157,6 +160,8 @@ class EmbedThumbnail(Model):
     :ivar width: The width of the file image
     :vartype width: Optional[int]
     """
+    __slots__ = ('url', 'proxy_url', 'height', 'width')
+
     url: Optional[str]
     proxy_url: Optional[str]
     height: Optional[int]
@@ -176,6 +181,8 @@ class EmbedVideo(Model):
     :ivar width: The width of the video
     :vartype width: Optional[int]
     """
+    __slots__ = ('url', 'height', 'width')
+
     url: Optional[str]
     height: Optional[int]
     width: Optional[int]
@@ -196,6 +203,8 @@ class EmbedImage(Model):
     :ivar width: The width of the image
     :vartype width: Optional[int]
     """
+    __slots__ = ('url', 'proxy_url', 'height', 'width')
+
     url: Optional[str]
     proxy_url: Optional[str]
     height: Optional[int]
@@ -213,6 +222,8 @@ class EmbedProvider(Model):
     :ivar url: The url to the embed provider
     :vartype url: Optional[str]
     """
+    __slots__ = ('name', 'url')
+
     name: Optional[str]
     url: Optional[str]
 
@@ -232,6 +243,8 @@ class EmbedAuthor(Model):
     :ivar icon_proxy_url: A url for the image that goes through discord first
     :vartype icon_proxy_url: Optional[str]
     """
+    __slots__ = ('name', 'url', 'icon_url', 'icon_proxy_url')
+
     name: Optional[str]
     url: Optional[str]
     icon_url: Optional[str]
@@ -251,6 +264,8 @@ class EmbedFooter(Model):
     :ivar icon_proxy_url: A url that is linked to discord which has the icon_url
     :vartype icon_proxy_url: Optional[str]
     """
+    __slots__ = ('text', 'icon_url', 'icon_proxy_url')
+
     text: str
     icon_url: Optional[str]
     icon_proxy_url: Optional[str]
@@ -269,6 +284,8 @@ class EmbedField(Model):
     :ivar inline: If True, it will be organized better with the other fields
     :vartype inline: Optional[bool]
     """
+    __slots__ = ('name', 'value', 'inline')
+
     name: str
     value: str
     inline: Optional[bool]
@@ -310,6 +327,12 @@ class Embed(Model):
     :ivar fields: A list of fields that will be on the body of the embed
     :vartype fields: Optional[List[:py:class:`~pycord.models.message.EmbedField`]]
     """
+    __slots__ = (
+        'title', 'type', 'description', 'url', 'timestamp', 'color', 'footer', 'image', 'thumbnail', 'video',
+        'provider', 'author', 'fields', '_timestamp_date_cache'
+    )
+    _intern_fields = ('type',)
+
     title: Optional[str]
     type: Optional[str]
     description: Optional[str]
@@ -324,7 +347,7 @@ class Embed(Model):
     author: Optional[pycord.config.EMBED_AUTHOR]
     fields: Optional[List[pycord.config.EMBED_FIELD]]
 
-    @comboproperty
+    @cached_comboproperty
     def timestamp_date(self):
         return parse_timestamp(self.timestamp) if self.timestamp else None
 
@@ -342,6 +365,8 @@ class Reaction(Model):
     :ivar emoji: The emoji that's being used to react
     :vartype emoji: :py:class:`~pycord.models.emoji.Emoji`
     """
+    __slots__ = ('count', 'me', 'emoji')
+
     count: int
     me: bool
     emoji: pycord.config.EMOJI
@@ -378,16 +403,16 @@ class Message(Model):
     :vartype tts: False
     :ivar mention_everyone: If True, the message includes a @everyone
     :vartype mention_everyone: bool
-    :ivar mentions: A list of people mentioned, these user objects will have the member property
-    :vartype mentions: List[:py:class:`~pycord.models.user.User`]
+    :ivar mentions: A read-only list of people mentioned, these user objects will have the member property
+    :vartype mentions: :py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.user.User`]
     :ivar mention_roles: A list of snowflakes related to the roles that were mentioned in the message
     :vartype mention_roles: List[:py:class:`~pycord.models.snowflake.Snowflake`]
-    :ivar attachments: A list of files that were sent with the message
-    :vartype attachments: List[:py:class:`~pycord.models.message.Attachment`]
-    :ivar embeds: A list of embeds that were sent with the message
-    :vartype embeds: List[:py:class:`~pycord.models.message.Embed`]
-    :ivar reactions: A list of reactions to the message, if applicable
-    :vartype reactions: List[:py:class:`~pycord.models.message.Reaction`]
+    :ivar attachments: A read-only list of files that were sent with the message
+    :vartype attachments: :py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.message.Attachment`]
+    :ivar embeds: A read-only list of embeds that were sent with the message
+    :vartype embeds: :py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.message.Embed`]
+    :ivar reactions: A read-only list of reactions to the message, if applicable
+    :vartype reactions: :py:class:`~pycord.models.base.LazyList`[:py:class:`~pycord.models.message.Reaction`]
     :ivar nonce: A special little snowflake (see what I did there) to confirm the message was sent
     :vartype nonce: Optional[:py:class:`~pycord.models.snowflake.Snowflake`]
     :ivar pinned: If True, the message was pinned to the channel
@@ -403,6 +428,14 @@ class Message(Model):
     :ivar application: If the message is a special kind of special, super special information
     :vartype application: Optional[:py:class:`~pycord.models.message.MessageApplication`]
     """
+    __slots__ = (
+        'id', 'channel_id', 'guild_id', 'author', 'member', 'content', 'timestamp', 'edited_timestamp', 'tts',
+        'mention_everyone', 'mentions', 'mention_roles', 'attachments', 'embeds', 'reactions', 'nonce', 'pinned',
+        'webhook_id', 'type', 'activity', 'application', '_timestamp_date_cache', '_edited_timestamp_date_cache'
+    )
+    # Plenty of bots only ever look at the content, so only build these once they're used
+    _deferred_fields = ('mentions', 'attachments', 'embeds', 'reactions')
+
     id: pycord.config.SNOWFLAKE
     channel_id: pycord.config.SNOWFLAKE
     guild_id: Optional[pycord.config.SNOWFLAKE]
@@ -427,14 +460,12 @@ class Message(Model):
 
     @comboproperty
     def message_type(self):
-        for enum in MessageTypes:
-            if enum.value == self.type:
-                return enum
+        return MessageTypes.from_value(self.type)
 
-    @comboproperty
+    @cached_comboproperty
     def timestamp_date(self):
         return parse_timestamp(self.timestamp)
 
-    @comboproperty
+    @cached_comboproperty
     def edited_timestamp_date(self):
         return parse_timestamp(self.edited_timestamp) if self.edited_timestamp else None
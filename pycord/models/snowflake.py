@@ -1,4 +1,6 @@
 from datetime import datetime
+from functools import lru_cache
+from time import time
 
 DISCORD_EPOCH = 1420070400000
 
@@ -19,6 +21,8 @@ class Snowflake(int):
     :ivar timestamp: A datetime object containing the point in time that the snowflake was created
     :vartype timestamp: datetime.datetime
     """
+    # Snowflakes are made for every ID in every payload, so don't give each one an empty __dict__
+    __slots__ = ()
 
     @property
     def increment(self):
@@ -52,10 +56,12 @@ class Snowflake(int):
         """
         if self <= 0:
             return False
-        elif 22 > self.bit_length() > 64:
+        elif not 22 <= self.bit_length() <= 64:
             return False
-        elif self.timestamp < datetime.utcfromtimestamp(DISCORD_EPOCH / 1000):
-            return False
-        elif self.timestamp > datetime.now():
-            return False
-        return True
+        # Compare in milliseconds since the unix epoch, instead of building datetimes. The timestamp can't be before the
+        # discord epoch, since it's counted from it and the snowflake is positive.
+        return (self >> 22) + DISCORD_EPOCH <= time() * 1000
+
+
+# Guild and channel IDs show up in payload after payload, so models share the Snowflakes made for recent IDs
+Snowflake._d_load = lru_cache(maxsize=4096)(Snowflake)
@@ -3,10 +3,15 @@ from enum import Enum
 from typing import Optional, Union
 
 import pycord.config
-from .base import comboproperty, Model
+from .base import cached_comboproperty, Model
 
 from combomethod import combomethod
 
+AVATAR_URL = "https://cdn.discordapp.com/avatars/"
+DEFAULT_AVATAR_URL = "https://cdn.discordapp.com/embed/avatars/"
+# There's only 5 default avatars, so every user without an avatar can share one of these
+_DEFAULT_AVATARS = tuple(f"{DEFAULT_AVATAR_URL}{i}.png" for i in range(5))
+
 
 class UserFlags(Enum):
     """
@@ -75,6 +80,10 @@ class User(Model):
     :ivar premiuum_type: The ID of a this user's paid subscription, None if not applicable.
     :vartype premium_type: Optional[int]
     """
+    __slots__ = (
+        'id', 'username', 'discriminator', 'avatar', 'member', 'flags', 'premium_type', '_avatar_url_cache',
+        '_mention_cache', '_name_cache'
+    )
 
     id: pycord.config.SNOWFLAKE
     username: str
@@ -84,28 +93,21 @@ class User(Model):
     flags: int
     premium_type: Optional[int]
 
-    @comboproperty
+    @cached_comboproperty
     def avatar_url(self):
-        if self.avatar:
-            if self.avatar.startswith("a_"):
-                return "https://cdn.discordapp.com/avatars/{user_id}/{user_avatar}.gif".format(
-                    user_id=self.id,
-                    user_avatar=self.avatar
-                )
-            else:
-                return "https://cdn.discordapp.com/avatars/{user_id}/{user_avatar}.png".format(
-                    user_id=self.id,
-                    user_avatar=self.avatar
-                )
-        return "https://cdn.discordapp.com/embed/avatars/{discrim}.png".format(discrim=self.discriminator % 5)
-
-    @comboproperty
+        avatar = self.avatar
+        if avatar:
+            extension = "gif" if avatar.startswith("a_") else "png"
+            return f"{AVATAR_URL}{self.id}/{avatar}.{extension}"
+        return _DEFAULT_AVATARS[int(self.discriminator) % 5]
+
+    @cached_comboproperty
     def mention(self):
-        return "<@{user_id}>".format(user_id=self.id)
+        return f"<@{self.id}>"
 
-    @comboproperty
+    @cached_comboproperty
     def name(self):
-        return "{username}#{discrim}".format(username=self.username, discrim=self.discriminator)
+        return f"{self.username}#{self.discriminator}"
 
     @combomethod
     def has(self, flag_or_premium: Union[UserFlags, PremiumTypes]):
@@ -120,12 +122,8 @@ class User(Model):
         :return: True if the user does have the service else False
         :rtype: bool
         """
-        if flag_or_premium in UserFlags:
-            if flag_or_premium.value & self.flags:
-                return True
-        elif flag_or_premium in PremiumTypes:
-            if flag_or_premium.value == self.premium_type:
-                return True
-        else:
-            raise ValueError("Value provided was not in UserFlags enum nor PremiumTypes enum.")
-        return False
+        if isinstance(flag_or_premium, UserFlags):
+            return bool(flag_or_premium.value & self.flags)
+        elif isinstance(flag_or_premium, PremiumTypes):
+            return flag_or_premium.value == self.premium_type
+        raise ValueError("Value provided was not in UserFlags enum nor PremiumTypes enum.")
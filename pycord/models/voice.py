@@ -1,3 +1,4 @@
+from __future__ import annotations
 from typing import Optional
 
 import pycord.config
@@ -32,6 +33,11 @@ class VoiceState(Model):
     :ivar suppress: If True, a priority speaking is speaking and the user's volume is decreased
     :vartype suppress: bool
     """
+    __slots__ = ('guild_id', 'channel_id', 'user_id', '_member_raw', '_member_cache', 'session_id', '_flags')
+    # Guilds send a voice state for everyone in a voice channel, but their members are rarely needed
+    _lazy_fields = ('member',)
+    _flag_fields = ('deaf', 'mute', 'self_deaf', 'self_mute', 'suppress')
+
     guild_id: Optional[pycord.config.SNOWFLAKE]
     channel_id: Optional[pycord.config.SNOWFLAKE]
     user_id: pycord.config.SNOWFLAKE
@@ -64,6 +70,11 @@ class VoiceRegion(Model):
     :ivar custom: If True, this is a special voice server, used for events, whatever that would be
     :vartype custom: bool
     """
+    __slots__ = ('id', 'name', 'vip', 'optimal', 'deprecated', 'custom', '__weakref__')
+    _intern_fields = ('id', 'name')
+    # There's only a few regions, and they're the same every time they're fetched
+    _reuse_instances = True
+
     id: str
     name: str
     vip: bool
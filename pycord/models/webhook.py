@@ -5,6 +5,10 @@ import pycord.config
 from .base import Model
 
 
+def _user_id(data):
+    return (data.get('user') or {}).get('id')
+
+
 class Webhook(Model):
     """
     The pycord representation of discord webhooks
@@ -26,6 +30,12 @@ class Webhook(Model):
     :ivar token: The token that the webhook uses
     :vartype token: str
     """
+    __slots__ = ('id', 'guild_id', 'channel_id', 'user', 'name', 'avatar', 'token', '__weakref__')
+    # The same webhooks get fetched over and over, so reuse them while they're still around. The user isn't hashable,
+    # and is left out when fetching by token, so the key has the user's ID instead.
+    _reuse_instances = True
+    _reuse_key = ('id', 'guild_id', 'channel_id', 'name', 'avatar', 'token', _user_id)
+
     id: pycord.config.SNOWFLAKE
     guild_id: Optional[pycord.config.SNOWFLAKE]
     channel_id: Optional[pycord.config.SNOWFLAKE]